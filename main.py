@@ -1,19 +1,37 @@
 from fastmcp import FastMCP
 import os
 import asyncio
+import functools
+import sys
 import aiosqlite
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import anyio
+import orjson
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "expenses.db")
 CATEGORIES_PATH = os.path.join(os.path.dirname(__file__), "categories.json")
-
-# Create a FastMCP server instance
-mcp = FastMCP(name="Expense Tracker MCP Server")
-
-async def init_db() -> None:
-    async with aiosqlite.connect(DB_PATH) as c:
-        await c.execute("""
+READ_POOL_SIZE = 4
+
+# Connection tuning shared by the writer and the read-only pool.
+_COMMON_PRAGMAS_SQL = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;  -- 64 MB
+    PRAGMA mmap_size=268435456;  -- 256 MB
+    PRAGMA busy_timeout=5000;
+"""
+# Run once on the writer at startup as a single script.
+# WAL lets readers run alongside a writer; NORMAL sync is safe under WAL
+# and avoids an fsync on every commit. Equality columns lead the indexes, then
+# date: list_expenses seeks idx_exp_date and reads rows already in date order,
+# and summarize seeks the date range of idx_exp_type_date_cat as a covering
+# index (no table lookups), grouping by category in a small temp B-tree.
+# idx_exp_type_cat_date was an earlier column order the planner ignored.
+_BOOTSTRAP_SQL = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+""" + _COMMON_PRAGMAS_SQL + """
     CREATE TABLE IF NOT EXISTS expenses(
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         date TEXT NOT NULL,
@@ -23,42 +41,190 @@ async def init_db() -> None:
         note TEXT DEFAULT '',
         type TEXT NOT NULL DEFAULT 'expense',
         is_deleted INTEGER NOT NULL DEFAULT 0
-    )
-""")
-        await c.commit()
-_db_initialized: bool = False
-_db_init_lock: asyncio.Lock = asyncio.Lock()
-
-async def ensure_db() -> None:
-    global _db_initialized
-    if _db_initialized:
-        return
-    async with _db_init_lock:
-        if _db_initialized:
-            return
-        await init_db()
-        _db_initialized = True
+    );
+    CREATE INDEX IF NOT EXISTS idx_exp_date ON expenses(is_deleted, date);
+    DROP INDEX IF EXISTS idx_exp_type_cat_date;
+    CREATE INDEX IF NOT EXISTS idx_exp_type_date_cat ON expenses(type, is_deleted, date, category, amount);
+    ANALYZE;
+"""
+
+# Fixed-shape statements, kept as stable strings so sqlite3's per-connection
+# statement cache hits instead of re-parsing on every call.
+_SQL: Dict[str, str] = {
+    "add_expense": "INSERT INTO expenses (amount, category, subcategory, note, date, type) VALUES (?, ?, ?, ?, ?, 'expense') RETURNING id",
+    "add_credit": "INSERT INTO expenses (amount, category, subcategory, note, date, type) VALUES (?, ?, '', ?, ?, 'income') RETURNING id",
+    "add_expenses_bulk": "INSERT INTO expenses (amount, category, subcategory, note, date, type) VALUES (?, ?, ?, ?, ?, 'expense')",
+    "list_expenses": """
+        SELECT id, date, amount, category, subcategory, note, type
+        FROM expenses
+        WHERE date BETWEEN ? AND ? AND is_deleted = 0
+        ORDER BY date ASC, id ASC
+        LIMIT ?
+    """,
+    # Keyset page: seek the index straight to the (date, id) of the previous page's last entry.
+    "list_expenses_after": """
+        SELECT e.id, e.date, e.amount, e.category, e.subcategory, e.note, e.type
+        FROM expenses e, (SELECT date, id FROM expenses WHERE id = ?3) AS prev
+        WHERE e.date BETWEEN max(?1, prev.date) AND ?2 AND e.is_deleted = 0
+            AND (e.date, e.id) > (prev.date, prev.id)
+        ORDER BY e.date ASC, e.id ASC
+        LIMIT ?4
+    """,
+    "summarize": """
+        SELECT category, CAST(SUM(amount) AS REAL) AS total_amount
+        FROM expenses
+        WHERE date BETWEEN ? AND ? AND type = 'expense' AND is_deleted = 0
+        GROUP BY category ORDER BY category ASC
+    """,
+    "summarize_category": """
+        SELECT category, CAST(SUM(amount) AS REAL) AS total_amount
+        FROM expenses
+        WHERE date BETWEEN ? AND ? AND type = 'expense' AND is_deleted = 0 AND category = ?
+        GROUP BY category ORDER BY category ASC
+    """,
+    "entry_exists": "SELECT 1 FROM expenses WHERE id = ?",
+    "delete_expense": "UPDATE expenses SET is_deleted = 1 WHERE id = ?",
+    "restore_expense": "UPDATE expenses SET is_deleted = 0 WHERE id = ?",
+}
+STATEMENT_CACHE_SIZE = 512
+MAX_LIST_LIMIT = 1000
+_MAX_SQLITE_INT = 2**63 - 1
+
+# Shared connection, opened once and kept for the server's lifetime.
+# SQLite only allows one writer at a time, so writes go through write_conn(), which
+# serializes them with _write_lock and commits or rolls back each one as a unit.
+_conn: Optional[aiosqlite.Connection] = None
+_write_lock: asyncio.Lock = asyncio.Lock()
+# Read-only connections checked out by read_conn(); WAL allows them to run concurrently.
+_read_pool: Optional["asyncio.Queue[aiosqlite.Connection]"] = None
+# Every reader opened, idle or checked out, so close_db() can close them all.
+_readers: List[aiosqlite.Connection] = []
 
+async def init_db() -> None:
+    global _conn, _read_pool
+    conn = await aiosqlite.connect(DB_PATH, cached_statements=STATEMENT_CACHE_SIZE)
+    await conn.executescript(_BOOTSTRAP_SQL)
+
+    pool: "asyncio.Queue[aiosqlite.Connection]" = asyncio.Queue()
+    read_uri = Path(DB_PATH).resolve().as_uri() + "?mode=ro"
+    for _ in range(READ_POOL_SIZE):
+        reader = await aiosqlite.connect(read_uri, uri=True, cached_statements=STATEMENT_CACHE_SIZE)
+        await reader.executescript(_COMMON_PRAGMAS_SQL)
+        _readers.append(reader)
+        pool.put_nowait(reader)
+
+    _read_pool = pool
+    _conn = conn
+
+async def close_db() -> None:
+    global _conn, _read_pool
+    # Readers still checked out are closed too; aiosqlite runs the close after
+    # their in-flight query, and read_conn() won't return them to the old pool.
+    _read_pool = None
+    while _readers:
+        await _readers.pop().close()
+    if _conn is not None:
+        await _conn.close()
+        _conn = None
+
+@asynccontextmanager
+async def write_conn() -> AsyncIterator[aiosqlite.Connection]:
+    """Hold the writer for one write: commit on success, roll back on any failure."""
+    async with _write_lock:
+        try:
+            yield _conn
+            await _conn.commit()
+        except BaseException:
+            # Never leave a half-done transaction (body or commit failed) for the
+            # next caller's commit to pick up
+            with anyio.CancelScope(shield=True):
+                await _conn.rollback()
+            raise
+
+@asynccontextmanager
+async def read_conn() -> AsyncIterator[aiosqlite.Connection]:
+    """Check out a read-only connection from the pool for the duration of the block."""
+    pool = _read_pool
+    conn = await pool.get()
+    try:
+        yield conn
+    finally:
+        # After close_db() the connection is already closed; only return it to a live pool
+        if _read_pool is pool:
+            pool.put_nowait(conn)
 
-def _validate_date(date_str: str) -> bool:
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    # Open the database once at startup so tools can use _conn/_read_pool directly.
+    await init_db()
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True
-    except Exception:
+        yield
+    finally:
+        # Shield shutdown so a cancelled server task still closes every connection.
+        with anyio.CancelScope(shield=True):
+            await close_db()
+
+def _serialize_result(data: Any) -> str:
+    # Tool results are plain dicts/lists of primitives, which orjson encodes far faster
+    # than FastMCP's default; anything it rejects falls back to the default serializer.
+    return orjson.dumps(data).decode()
+
+# Create a FastMCP server instance
+mcp = FastMCP(name="Expense Tracker MCP Server", lifespan=lifespan, tool_serializer=_serialize_result)
+
+
+_ISO_DATE_LEN = 10  # len("YYYY-MM-DD")
+# Days per month (index 1-12); February allows 29 and leap years are checked separately.
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _validate_date(date_str: str) -> bool:
+    """Check for a real YYYY-MM-DD date using fixed-position ASCII checks (no datetime parsing)."""
+    if not (
+        isinstance(date_str, str)
+        and len(date_str) == _ISO_DATE_LEN
+        and date_str.isascii()
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str[0:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:10].isdigit()
+        and date_str[0:4] != "0000"
+    ):
         return False
+    month = (ord(date_str[5]) - 48) * 10 + (ord(date_str[6]) - 48)
+    day = (ord(date_str[8]) - 48) * 10 + (ord(date_str[9]) - 48)
+    if not (1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month]):
+        return False
+    if month == 2 and day == 29:
+        year = int(date_str[0:4])
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return True
+
+def _validate_range(start_date: str, end_date: str) -> bool:
+    # YYYY-MM-DD strings order the same as the dates, so a plain string compare checks the bounds
+    return start_date <= end_date and _validate_date(start_date) and _validate_date(end_date)
 
 def _validate_amount(amount: float) -> bool:
-    try:
-        return float(amount) >= 0
-    except Exception:
-        return False
+    # Tool arguments are already coerced to float by FastMCP. Bools (an int subclass) are
+    # not amounts, and the finite-range check rejects NaN and inf, which SQLite would
+    # store as NULL, as well as ints too large to become a float.
+    return not isinstance(amount, bool) and isinstance(amount, (int, float)) and 0 <= amount <= sys.float_info.max
+
+# Columns edit_expense can set, in bit order for _edit_sql's mask.
+_EDIT_COLUMNS = ("amount", "category", "subcategory", "note", "date")
+
+@functools.lru_cache(maxsize=64)
+def _edit_sql(mask: int) -> str:
+    """Build (once per mask) the UPDATE for the _EDIT_COLUMNS selected by mask; bit 0 is amount."""
+    fields = [f"{column} = ?" for bit, column in enumerate(_EDIT_COLUMNS) if mask >> bit & 1]
+    return f"UPDATE expenses SET {', '.join(fields)} WHERE id = ?"
 
 
 # ADD EXPENSE
 @mcp.tool()
 async def add_expense(amount: float, category: str, subcategory: str, note: str, date: str) -> Dict[str, Any]:
     """Add a new expense entry."""
-    await ensure_db()
     subcategory = subcategory or ""
     note = note or ""
 
@@ -66,88 +232,128 @@ async def add_expense(amount: float, category: str, subcategory: str, note: str,
         return {"status": "error", "message": "Invalid amount"}
     if not _validate_date(date):
         return {"status": "error", "message": "Invalid date format. Use YYYY-MM-DD"}
-    async with aiosqlite.connect(DB_PATH) as conn:
-        cursor = await conn.execute(
-            "INSERT INTO expenses (amount, category, subcategory, note, date, type) VALUES (?, ?, ?, ?, ?, 'expense')",
+    async with write_conn() as conn:
+        rows = await conn.execute_fetchall(
+            _SQL["add_expense"],
             (amount, category, subcategory, note, date)
         )
-        await conn.commit()
-        return {"status": "success", "id": cursor.lastrowid, "message": "Expense added successfully"}
+    return {"status": "success", "id": rows[0][0], "message": "Expense added successfully"}
 
 
 # ADD CREDIT (INCOME)
 @mcp.tool()
 async def add_credit(amount: float, source: str, note: str, date: str) -> Dict[str, Any]:
     """Add an income/credit (e.g., salary)."""
-    await ensure_db()
     note = note or ""
 
     if not _validate_amount(amount):
         return {"status": "error", "message": "Invalid amount"}
     if not _validate_date(date):
         return {"status": "error", "message": "Invalid date format. Use YYYY-MM-DD"}
-    async with aiosqlite.connect(DB_PATH) as conn:
-        cursor = await conn.execute(
-            "INSERT INTO expenses (amount, category, subcategory, note, date, type) VALUES (?, ?, '', ?, ?, 'income')",
+    async with write_conn() as conn:
+        rows = await conn.execute_fetchall(
+            _SQL["add_credit"],
             (amount, source, note, date)
         )
-        await conn.commit()
-        return {"status": "success", "id": cursor.lastrowid, "message": "Credit added successfully"}
+    return {"status": "success", "id": rows[0][0], "message": "Credit added successfully"}
+
+
+# ADD EXPENSES IN BULK
+@mcp.tool()
+async def add_expenses_bulk(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Add many expense entries at once. Each row needs amount, category and date; subcategory and note are optional."""
+    if not rows:
+        return {"status": "error", "message": "No rows provided"}
+
+    # Validate every row up front (rows are not coerced by the tool schema), so nothing
+    # can fail at bind time; write_conn() still rolls the whole batch back if it does.
+    payload: List[Tuple[Any, ...]] = []
+    for i, row in enumerate(rows):
+        amount = row.get("amount")
+        category = row.get("category")
+        subcategory = row.get("subcategory") or ""
+        note = row.get("note") or ""
+        date = row.get("date")
+        if amount is None or not _validate_amount(amount):
+            return {"status": "error", "message": f"Row {i}: Invalid amount"}
+        if not category:
+            return {"status": "error", "message": f"Row {i}: Missing category"}
+        if not isinstance(category, str):
+            return {"status": "error", "message": f"Row {i}: Invalid category"}
+        if not isinstance(subcategory, str):
+            return {"status": "error", "message": f"Row {i}: Invalid subcategory"}
+        if not isinstance(note, str):
+            return {"status": "error", "message": f"Row {i}: Invalid note"}
+        if not _validate_date(date):
+            return {"status": "error", "message": f"Row {i}: Invalid date format. Use YYYY-MM-DD"}
+        # float() keeps huge ints bindable; the column is REAL anyway
+        payload.append((float(amount), category, subcategory, note, date))
+
+    async with write_conn() as conn:
+        await conn.executemany(_SQL["add_expenses_bulk"], payload)
+    return {"status": "success", "count": len(payload), "message": f"{len(payload)} expenses added successfully"}
 
 
 # LIST EXPENSES / INCOME
 @mcp.tool()
-async def list_expenses(start_date: str, end_date: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
-    """List all expense entries within an inclusive date range."""
-    await ensure_db()
-    if not (_validate_date(start_date) and _validate_date(end_date)):
-        return {"status": "error", "message": "Invalid date range format. Use YYYY-MM-DD"}
-
-    async with aiosqlite.connect(DB_PATH) as c:
-        c.row_factory = aiosqlite.Row
-        cur = await c.execute(
-            """
-            SELECT id, date, amount, category, subcategory, note, type
-            FROM expenses
-            WHERE date BETWEEN ? AND ? AND is_deleted = 0
-            ORDER BY date ASC, id ASC
-            """,
-            (start_date, end_date),
-        )
+async def list_expenses(start_date: str, end_date: str, limit: int = MAX_LIST_LIMIT,
+                        after_id: Optional[int] = None) -> Dict[str, Any]:
+    """List expense entries within an inclusive date range, at most `limit` (1-1000) per page.
+    `next_after_id` is set when more entries exist; pass it back as `after_id` to fetch the next page."""
+    if not _validate_range(start_date, end_date):
+        return {"status": "error", "message": "Invalid date range. Use YYYY-MM-DD with start_date on or before end_date"}
+    if not 1 <= limit <= MAX_LIST_LIMIT:
+        return {"status": "error", "message": f"Invalid limit. Use 1-{MAX_LIST_LIMIT}"}
+    if after_id is not None and not 1 <= after_id <= _MAX_SQLITE_INT:
+        return {"status": "error", "message": "Invalid after_id"}
+
+    # Fetch one extra row to learn whether another page exists
+    if after_id is None:
+        query = _SQL["list_expenses"]
+        params: Tuple[Any, ...] = (start_date, end_date, limit + 1)
+    else:
+        query = _SQL["list_expenses_after"]
+        params = (start_date, end_date, after_id, limit + 1)
+
+    async with read_conn() as c:
+        cur = await c.execute(query, params)
         rows = await cur.fetchall()
-        return [dict(row) for row in rows]
+        # An empty page after a cursor is either the end of the range or an unknown id
+        if not rows and after_id is not None:
+            cur = await c.execute(_SQL["entry_exists"], (after_id,))
+            if await cur.fetchone() is None:
+                return {"status": "error", "message": "Invalid after_id"}
+
+    has_more = len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+    return {
+        "status": "success",
+        "entries": [
+            {"id": r[0], "date": r[1], "amount": r[2], "category": r[3], "subcategory": r[4], "note": r[5], "type": r[6]}
+            for r in rows
+        ],
+        "next_after_id": rows[-1][0] if has_more else None,
+    }
 
 
 # SUMMARIZE EXPENSES
 @mcp.tool()
 async def summarize(start_date: str, end_date: str, category: Optional[str] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
     """Summarize expenses by category within an inclusive date range (expense only)."""
-    await ensure_db()
-    if not (_validate_date(start_date) and _validate_date(end_date)):
-        return {"status": "error", "message": "Invalid date range format. Use YYYY-MM-DD"}
-
-    async with aiosqlite.connect(DB_PATH) as c:
-        c.row_factory = aiosqlite.Row
-        query = """
-            SELECT category, SUM(amount) AS total_amount
-            FROM expenses
-            WHERE date BETWEEN ? AND ? AND type = 'expense' AND is_deleted = 0
-        """
-        params = [start_date, end_date]
-
-        if category:
-            query += " AND category = ?"
-            params.append(category)
+    if not _validate_range(start_date, end_date):
+        return {"status": "error", "message": "Invalid date range. Use YYYY-MM-DD with start_date on or before end_date"}
 
-        query += " GROUP BY category ORDER BY category ASC"
+    if category:
+        query = _SQL["summarize_category"]
+        params: Tuple[str, ...] = (start_date, end_date, category)
+    else:
+        query = _SQL["summarize"]
+        params = (start_date, end_date)
 
+    async with read_conn() as c:
         cur = await c.execute(query, params)
-        results = [dict(row) for row in await cur.fetchall()]
-        # ensure total_amount is float
-        for r in results:
-            if "total_amount" in r and r["total_amount"] is not None:
-                r["total_amount"] = float(r["total_amount"])
-        return results
+        return [{"category": cat, "total_amount": total} for cat, total in await cur.fetchall()]
 
 
 # EDIT EXPENSE / INCOME
@@ -155,90 +361,73 @@ async def summarize(start_date: str, end_date: str, category: Optional[str] = No
 async def edit_expense(id: int, amount: Optional[float] = None, category: Optional[str] = None, subcategory: Optional[str] = None,
                  note: Optional[str] = None, date: Optional[str] = None) -> Dict[str, Any]:
     """Edit an existing expense or income entry."""
-    await ensure_db()
-    async with aiosqlite.connect(DB_PATH) as conn:
-
-        # Build dynamic update query
-        fields: List[str] = []
-        params: List[Any] = []
-
-        if amount is not None:
-            if not _validate_amount(amount):
-                return {"status": "error", "message": "Invalid amount"}
-            fields.append("amount = ?")
-            params.append(amount)
-
-        if category is not None:
-            fields.append("category = ?")
-            params.append(category)
-
-        if subcategory is not None:
-            fields.append("subcategory = ?")
-            params.append(subcategory)
-
-        if note is not None:
-            fields.append("note = ?")
-            params.append(note)
-
-        if date is not None:
-            if not _validate_date(date):
-                return {"status": "error", "message": "Invalid date format. Use YYYY-MM-DD"}
-            fields.append("date = ?")
-            params.append(date)
+    if amount is not None and not _validate_amount(amount):
+        return {"status": "error", "message": "Invalid amount"}
+    if date is not None and not _validate_date(date):
+        return {"status": "error", "message": "Invalid date format. Use YYYY-MM-DD"}
 
-        if not fields:
-            return {"status": "error", "message": "No fields provided to update"}
+    # Encode which fields are being set so the UPDATE string comes from _edit_sql's cache
+    mask = (
+        (amount is not None)
+        | (category is not None) << 1
+        | (subcategory is not None) << 2
+        | (note is not None) << 3
+        | (date is not None) << 4
+    )
+    if not mask:
+        return {"status": "error", "message": "No fields provided to update"}
 
-        params.append(id)
+    params: List[Any] = [value for value in (amount, category, subcategory, note, date) if value is not None]
+    params.append(id)
 
-        query = f"UPDATE expenses SET {', '.join(fields)} WHERE id = ?"
+    query = _edit_sql(mask)
+    async with write_conn() as conn:
         cursor = await conn.execute(query, params)
-        await conn.commit()
-        if cursor.rowcount == 0:
-            return {"status": "error", "message": "Expense not found"}
+    if cursor.rowcount == 0:
+        return {"status": "error", "message": "Expense not found"}
 
-        return {"status": "success", "message": "Expense updated successfully"}
+    return {"status": "success", "message": "Expense updated successfully"}
 
 
 # SOFT DELETE — mark the entry as hidden
 @mcp.tool()
 async def delete_expense(id: int) -> Dict[str, Any]:
     """Soft delete: hides an entry without removing it."""
-    await ensure_db()
-    async with aiosqlite.connect(DB_PATH) as conn:
-        cursor = await conn.execute(
-            "UPDATE expenses SET is_deleted = 1 WHERE id = ?",
-            (id,)
-        )
-        await conn.commit()
-        if cursor.rowcount == 0:
-            return {"status": "error", "message": "Entry not found"}
+    async with write_conn() as conn:
+        cursor = await conn.execute(_SQL["delete_expense"], (id,))
+    if cursor.rowcount == 0:
+        return {"status": "error", "message": "Entry not found"}
 
-        return {"status": "success", "message": "Entry hidden (soft deleted)"}
+    return {"status": "success", "message": "Entry hidden (soft deleted)"}
     
 
 @mcp.tool()
 async def restore_expense(id: int) -> Dict[str, Any]:
     """Restore a previously deleted entry."""
-    await ensure_db()
-    async with aiosqlite.connect(DB_PATH) as conn:
-        cursor = await conn.execute(
-            "UPDATE expenses SET is_deleted = 0 WHERE id = ?",
-            (id,)
-        )
-        await conn.commit()
-        if cursor.rowcount == 0:
-            return {"status": "error", "message": "Entry not found or already active"}
+    async with write_conn() as conn:
+        cursor = await conn.execute(_SQL["restore_expense"], (id,))
+    if cursor.rowcount == 0:
+        return {"status": "error", "message": "Entry not found or already active"}
 
-        return {"status": "success", "message": "Entry restored"}
+    return {"status": "success", "message": "Entry restored"}
 
 
 
 # CATEGORIES RESOURCE
+# (mtime_ns, contents) of categories.json, so the file is only read again after it is edited
+_categories_cache: Optional[Tuple[int, str]] = None
+
 @mcp.resource("expense://categories", mime_type="application/json")
 async def categories() -> str:
-    """Serve categories.json as a resource."""
-    return await asyncio.to_thread(lambda: open(CATEGORIES_PATH, "r", encoding="utf-8").read())
+    """Serve categories.json as a resource, re-reading it only when the file changes."""
+    global _categories_cache
+    mtime = os.stat(CATEGORIES_PATH).st_mtime_ns
+    if _categories_cache is None or _categories_cache[0] != mtime:
+        # The file is a few KB; reading it inline is cheaper than a thread-pool hop
+        with open(CATEGORIES_PATH, "r", encoding="utf-8") as f:
+            text = f.read()
+        _categories_cache = (mtime, text)
+    return _categories_cache[1]
 
 # RUN SERVER
 if __name__ == "__main__":